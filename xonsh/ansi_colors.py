@@ -205,11 +205,28 @@ def ansi_color_escape_code_to_name(escape_code, style, reversed_style=None):
     too, which is just the keys/values of the style dict swapped. If reversed
     style is not provided, it is computed.
     """
-    key = (escape_code, style)
-    if key in _ANSI_COLOR_ESCAPE_CODE_TO_NAME_CACHE:
-        return _ANSI_COLOR_ESCAPE_CODE_TO_NAME_CACHE[key]
+    # The names only depend on the reversed style, so each cache entry keeps
+    # the mapping it was computed from, and is only reused while that mapping
+    # is still the one in use. This also keeps an id() key from being reused.
+    if reversed_style is not None:
+        key = (escape_code, id(reversed_style))
+    elif isinstance(style, str):
+        key = (escape_code, style)
+    else:
+        key = None
+    if key is not None:
+        cached = _ANSI_COLOR_ESCAPE_CODE_TO_NAME_CACHE.get(key)
+        if cached is not None:
+            source, rtn = cached
+            if source is (
+                reversed_style if reversed_style is not None else ANSI_STYLES.get(style)
+            ):
+                return rtn
     if reversed_style is None:
         style, reversed_style = ansi_reverse_style(style, return_style=True)
+        source = style
+    else:
+        source = reversed_style
     # strip some actual escape codes, if needed.
     ec = ANSI_ESCAPE_CODE_RE.match(escape_code).group(2)
     names = []
@@ -271,10 +288,10 @@ def ansi_color_escape_code_to_name(escape_code, style, reversed_style=None):
         norm_names.append(n)
         n = ""
     # return
-    if len(norm_names) == 0:
-        return ("NO_COLOR",)
-    else:
-        return tuple(norm_names)
+    rtn = tuple(norm_names) if norm_names else ("NO_COLOR",)
+    if key is not None:
+        _ANSI_COLOR_ESCAPE_CODE_TO_NAME_CACHE[key] = (source, rtn)
+    return rtn
 
 
 def _ansi_expand_style(cmap):
@@ -3,15 +3,12 @@
 import os
 import re
 import sys
-import pprint
-import textwrap
-import locale
+import types
 import builtins
-import warnings
+import importlib
 import contextlib
 import collections
 import collections.abc as cabc
-import subprocess
 
 from xonsh import __version__ as XONSH_VERSION
 from xonsh.lazyasd import LazyObject, lazyobject
@@ -87,6 +84,19 @@ from xonsh.ansi_colors import (
 )
 import xonsh.prompt.base as prompt
 
+# only needed off the startup path, for locales, dircolors, warnings, and help
+locale = LazyObject(lambda: importlib.import_module("locale"), globals(), "locale")
+subprocess = LazyObject(
+    lambda: importlib.import_module("subprocess"), globals(), "subprocess"
+)
+pprint = LazyObject(lambda: importlib.import_module("pprint"), globals(), "pprint")
+textwrap = LazyObject(
+    lambda: importlib.import_module("textwrap"), globals(), "textwrap"
+)
+warnings = LazyObject(
+    lambda: importlib.import_module("warnings"), globals(), "warnings"
+)
+
 
 events.doc(
     "on_envvar_new",
@@ -123,14 +133,13 @@ command.
 )
 
 
-@lazyobject
-def HELP_TEMPLATE():
-    return (
-        "{{INTENSE_RED}}{envvar}{{NO_COLOR}}:\n\n"
-        "{{INTENSE_YELLOW}}{docstr}{{NO_COLOR}}\n\n"
-        "default: {{CYAN}}{default}{{NO_COLOR}}\n"
-        "configurable: {{CYAN}}{configurable}{{NO_COLOR}}"
-    )
+# adjacent literals are joined by the compiler, so this is a single constant
+HELP_TEMPLATE = (
+    "{{INTENSE_RED}}{envvar}{{NO_COLOR}}:\n\n"
+    "{{INTENSE_YELLOW}}{docstr}{{NO_COLOR}}\n\n"
+    "default: {{CYAN}}{default}{{NO_COLOR}}\n"
+    "configurable: {{CYAN}}{configurable}{{NO_COLOR}}"
+)
 
 
 @lazyobject
@@ -149,12 +158,21 @@ def LOCALE_CATS():
 
 def locale_convert(key):
     """Creates a converter for a locale key."""
+    # resolve the category once, on first use so that the locale module
+    # is not needed at startup, rather than on every conversion
+    cat = DefaultNotGiven
 
     def lc_converter(val):
+        nonlocal cat
+        if cat is DefaultNotGiven:
+            cat = LOCALE_CATS.get(key)
         try:
-            locale.setlocale(LOCALE_CATS[key], val)
-            val = locale.setlocale(LOCALE_CATS[key])
-        except (locale.Error, KeyError):
+            if cat is None:
+                # e.g. LC_MESSAGES is not available on all platforms
+                raise locale.Error
+            locale.setlocale(cat, val)
+            val = locale.setlocale(cat)
+        except locale.Error:
             msg = "Failed to set locale {0!r} to {1!r}".format(key, val)
             warnings.warn(msg, RuntimeWarning)
         return val
@@ -167,12 +185,13 @@ def to_debug(x):
     execer's debug level.
     """
     val = to_bool_or_int(x)
-    if (
-        hasattr(builtins, "__xonsh__")
-        and hasattr(builtins.__xonsh__, "execer")
-        and builtins.__xonsh__.execer is not None
-    ):
-        builtins.__xonsh__.execer.debug_level = val
+    try:
+        execer = builtins.__xonsh__.execer
+    except AttributeError:
+        # still starting up, no execer yet
+        return val
+    if execer is not None:
+        execer.debug_level = val
     return val
 
 
@@ -181,173 +200,257 @@ def to_debug(x):
 #
 
 
-class LsColors(cabc.MutableMapping):
+# maps $PATH strings to where dircolors was found on them
+_DIRCOLORS_PATHS = {}
+
+
+def dircolors_path(path=None):
+    """Returns the path to the dircolors executable found on the given
+    search path (the process's $PATH if None), or None if it is not
+    available (as is always the case on Windows). Misses are not cached,
+    so a dircolors that is installed or put on $PATH later is still found.
+    """
+    if ON_WINDOWS:
+        return None
+    rtn = _DIRCOLORS_PATHS.get(path)
+    if rtn is None:
+        import shutil
+
+        rtn = shutil.which("dircolors", path=path)
+        if rtn is not None:
+            _DIRCOLORS_PATHS[path] = rtn
+    return rtn
+
+
+DIRCOLORS_ENV_VARS = ("TERM", "COLORTERM", "LANG", "LC_ALL", "LC_MESSAGES")
+DIRCOLORS_TIMEOUT = 2.0  # seconds
+# maps (filename, env items) to the parsed output of dircolors
+_DIRCOLORS_CACHE = {}
+
+
+@lazyobject
+def DIRCOLORS_QUOTED_RE():
+    return re.compile(r"'([^']*)'")
+
+
+@lazyobject
+def LS_COLORS_ITEM_RE():
+    return re.compile(r"([^:=]+)=([^:]*)")
+
+
+@lazyobject
+def DEFAULT_REVERSED_STYLE():
+    return ansi_reverse_style(style="default")
+
+
+# a tuple of pairs is folded into a single code object constant, so this is
+# cheaper to load at import than building a dict literal entry by entry
+_DEFAULT_LS_COLORS_ITEMS = (
+    ("*.7z", ("BOLD_RED",)),
+    ("*.Z", ("BOLD_RED",)),
+    ("*.aac", ("CYAN",)),
+    ("*.ace", ("BOLD_RED",)),
+    ("*.alz", ("BOLD_RED",)),
+    ("*.arc", ("BOLD_RED",)),
+    ("*.arj", ("BOLD_RED",)),
+    ("*.asf", ("BOLD_PURPLE",)),
+    ("*.au", ("CYAN",)),
+    ("*.avi", ("BOLD_PURPLE",)),
+    ("*.bmp", ("BOLD_PURPLE",)),
+    ("*.bz", ("BOLD_RED",)),
+    ("*.bz2", ("BOLD_RED",)),
+    ("*.cab", ("BOLD_RED",)),
+    ("*.cgm", ("BOLD_PURPLE",)),
+    ("*.cpio", ("BOLD_RED",)),
+    ("*.deb", ("BOLD_RED",)),
+    ("*.dl", ("BOLD_PURPLE",)),
+    ("*.dwm", ("BOLD_RED",)),
+    ("*.dz", ("BOLD_RED",)),
+    ("*.ear", ("BOLD_RED",)),
+    ("*.emf", ("BOLD_PURPLE",)),
+    ("*.esd", ("BOLD_RED",)),
+    ("*.flac", ("CYAN",)),
+    ("*.flc", ("BOLD_PURPLE",)),
+    ("*.fli", ("BOLD_PURPLE",)),
+    ("*.flv", ("BOLD_PURPLE",)),
+    ("*.gif", ("BOLD_PURPLE",)),
+    ("*.gl", ("BOLD_PURPLE",)),
+    ("*.gz", ("BOLD_RED",)),
+    ("*.jar", ("BOLD_RED",)),
+    ("*.jpeg", ("BOLD_PURPLE",)),
+    ("*.jpg", ("BOLD_PURPLE",)),
+    ("*.lha", ("BOLD_RED",)),
+    ("*.lrz", ("BOLD_RED",)),
+    ("*.lz", ("BOLD_RED",)),
+    ("*.lz4", ("BOLD_RED",)),
+    ("*.lzh", ("BOLD_RED",)),
+    ("*.lzma", ("BOLD_RED",)),
+    ("*.lzo", ("BOLD_RED",)),
+    ("*.m2v", ("BOLD_PURPLE",)),
+    ("*.m4a", ("CYAN",)),
+    ("*.m4v", ("BOLD_PURPLE",)),
+    ("*.mid", ("CYAN",)),
+    ("*.midi", ("CYAN",)),
+    ("*.mjpeg", ("BOLD_PURPLE",)),
+    ("*.mjpg", ("BOLD_PURPLE",)),
+    ("*.mka", ("CYAN",)),
+    ("*.mkv", ("BOLD_PURPLE",)),
+    ("*.mng", ("BOLD_PURPLE",)),
+    ("*.mov", ("BOLD_PURPLE",)),
+    ("*.mp3", ("CYAN",)),
+    ("*.mp4", ("BOLD_PURPLE",)),
+    ("*.mp4v", ("BOLD_PURPLE",)),
+    ("*.mpc", ("CYAN",)),
+    ("*.mpeg", ("BOLD_PURPLE",)),
+    ("*.mpg", ("BOLD_PURPLE",)),
+    ("*.nuv", ("BOLD_PURPLE",)),
+    ("*.oga", ("CYAN",)),
+    ("*.ogg", ("CYAN",)),
+    ("*.ogm", ("BOLD_PURPLE",)),
+    ("*.ogv", ("BOLD_PURPLE",)),
+    ("*.ogx", ("BOLD_PURPLE",)),
+    ("*.opus", ("CYAN",)),
+    ("*.pbm", ("BOLD_PURPLE",)),
+    ("*.pcx", ("BOLD_PURPLE",)),
+    ("*.pgm", ("BOLD_PURPLE",)),
+    ("*.png", ("BOLD_PURPLE",)),
+    ("*.ppm", ("BOLD_PURPLE",)),
+    ("*.qt", ("BOLD_PURPLE",)),
+    ("*.ra", ("CYAN",)),
+    ("*.rar", ("BOLD_RED",)),
+    ("*.rm", ("BOLD_PURPLE",)),
+    ("*.rmvb", ("BOLD_PURPLE",)),
+    ("*.rpm", ("BOLD_RED",)),
+    ("*.rz", ("BOLD_RED",)),
+    ("*.sar", ("BOLD_RED",)),
+    ("*.spx", ("CYAN",)),
+    ("*.svg", ("BOLD_PURPLE",)),
+    ("*.svgz", ("BOLD_PURPLE",)),
+    ("*.swm", ("BOLD_RED",)),
+    ("*.t7z", ("BOLD_RED",)),
+    ("*.tar", ("BOLD_RED",)),
+    ("*.taz", ("BOLD_RED",)),
+    ("*.tbz", ("BOLD_RED",)),
+    ("*.tbz2", ("BOLD_RED",)),
+    ("*.tga", ("BOLD_PURPLE",)),
+    ("*.tgz", ("BOLD_RED",)),
+    ("*.tif", ("BOLD_PURPLE",)),
+    ("*.tiff", ("BOLD_PURPLE",)),
+    ("*.tlz", ("BOLD_RED",)),
+    ("*.txz", ("BOLD_RED",)),
+    ("*.tz", ("BOLD_RED",)),
+    ("*.tzo", ("BOLD_RED",)),
+    ("*.tzst", ("BOLD_RED",)),
+    ("*.vob", ("BOLD_PURPLE",)),
+    ("*.war", ("BOLD_RED",)),
+    ("*.wav", ("CYAN",)),
+    ("*.webm", ("BOLD_PURPLE",)),
+    ("*.wim", ("BOLD_RED",)),
+    ("*.wmv", ("BOLD_PURPLE",)),
+    ("*.xbm", ("BOLD_PURPLE",)),
+    ("*.xcf", ("BOLD_PURPLE",)),
+    ("*.xpm", ("BOLD_PURPLE",)),
+    ("*.xspf", ("CYAN",)),
+    ("*.xwd", ("BOLD_PURPLE",)),
+    ("*.xz", ("BOLD_RED",)),
+    ("*.yuv", ("BOLD_PURPLE",)),
+    ("*.z", ("BOLD_RED",)),
+    ("*.zip", ("BOLD_RED",)),
+    ("*.zoo", ("BOLD_RED",)),
+    ("*.zst", ("BOLD_RED",)),
+    ("bd", ("BACKGROUND_BLACK", "YELLOW")),
+    ("ca", ("BLACK", "BACKGROUND_RED")),
+    ("cd", ("BACKGROUND_BLACK", "YELLOW")),
+    ("di", ("BOLD_BLUE",)),
+    ("do", ("BOLD_PURPLE",)),
+    ("ex", ("BOLD_GREEN",)),
+    ("ln", ("BOLD_CYAN",)),
+    ("mh", ("NO_COLOR",)),
+    ("mi", ("NO_COLOR",)),
+    ("or", ("BACKGROUND_BLACK", "RED")),
+    ("ow", ("BLUE", "BACKGROUND_GREEN")),
+    ("pi", ("BACKGROUND_BLACK", "YELLOW")),
+    ("rs", ("NO_COLOR",)),
+    ("sg", ("BLACK", "BACKGROUND_YELLOW")),
+    ("so", ("BOLD_PURPLE",)),
+    ("st", ("WHITE", "BACKGROUND_BLUE")),
+    ("su", ("WHITE", "BACKGROUND_RED")),
+    ("tw", ("BLACK", "BACKGROUND_GREEN")),
+)
+
+_DEFAULT_LS_COLORS = dict(_DEFAULT_LS_COLORS_ITEMS)
+
+
+class LsColors(dict):
     """Helps convert to/from $LS_COLORS format, respecting the xonsh color style.
     This accepts the same inputs as dict().
     """
 
-    default_settings = {
-        "*.7z": ("BOLD_RED",),
-        "*.Z": ("BOLD_RED",),
-        "*.aac": ("CYAN",),
-        "*.ace": ("BOLD_RED",),
-        "*.alz": ("BOLD_RED",),
-        "*.arc": ("BOLD_RED",),
-        "*.arj": ("BOLD_RED",),
-        "*.asf": ("BOLD_PURPLE",),
-        "*.au": ("CYAN",),
-        "*.avi": ("BOLD_PURPLE",),
-        "*.bmp": ("BOLD_PURPLE",),
-        "*.bz": ("BOLD_RED",),
-        "*.bz2": ("BOLD_RED",),
-        "*.cab": ("BOLD_RED",),
-        "*.cgm": ("BOLD_PURPLE",),
-        "*.cpio": ("BOLD_RED",),
-        "*.deb": ("BOLD_RED",),
-        "*.dl": ("BOLD_PURPLE",),
-        "*.dwm": ("BOLD_RED",),
-        "*.dz": ("BOLD_RED",),
-        "*.ear": ("BOLD_RED",),
-        "*.emf": ("BOLD_PURPLE",),
-        "*.esd": ("BOLD_RED",),
-        "*.flac": ("CYAN",),
-        "*.flc": ("BOLD_PURPLE",),
-        "*.fli": ("BOLD_PURPLE",),
-        "*.flv": ("BOLD_PURPLE",),
-        "*.gif": ("BOLD_PURPLE",),
-        "*.gl": ("BOLD_PURPLE",),
-        "*.gz": ("BOLD_RED",),
-        "*.jar": ("BOLD_RED",),
-        "*.jpeg": ("BOLD_PURPLE",),
-        "*.jpg": ("BOLD_PURPLE",),
-        "*.lha": ("BOLD_RED",),
-        "*.lrz": ("BOLD_RED",),
-        "*.lz": ("BOLD_RED",),
-        "*.lz4": ("BOLD_RED",),
-        "*.lzh": ("BOLD_RED",),
-        "*.lzma": ("BOLD_RED",),
-        "*.lzo": ("BOLD_RED",),
-        "*.m2v": ("BOLD_PURPLE",),
-        "*.m4a": ("CYAN",),
-        "*.m4v": ("BOLD_PURPLE",),
-        "*.mid": ("CYAN",),
-        "*.midi": ("CYAN",),
-        "*.mjpeg": ("BOLD_PURPLE",),
-        "*.mjpg": ("BOLD_PURPLE",),
-        "*.mka": ("CYAN",),
-        "*.mkv": ("BOLD_PURPLE",),
-        "*.mng": ("BOLD_PURPLE",),
-        "*.mov": ("BOLD_PURPLE",),
-        "*.mp3": ("CYAN",),
-        "*.mp4": ("BOLD_PURPLE",),
-        "*.mp4v": ("BOLD_PURPLE",),
-        "*.mpc": ("CYAN",),
-        "*.mpeg": ("BOLD_PURPLE",),
-        "*.mpg": ("BOLD_PURPLE",),
-        "*.nuv": ("BOLD_PURPLE",),
-        "*.oga": ("CYAN",),
-        "*.ogg": ("CYAN",),
-        "*.ogm": ("BOLD_PURPLE",),
-        "*.ogv": ("BOLD_PURPLE",),
-        "*.ogx": ("BOLD_PURPLE",),
-        "*.opus": ("CYAN",),
-        "*.pbm": ("BOLD_PURPLE",),
-        "*.pcx": ("BOLD_PURPLE",),
-        "*.pgm": ("BOLD_PURPLE",),
-        "*.png": ("BOLD_PURPLE",),
-        "*.ppm": ("BOLD_PURPLE",),
-        "*.qt": ("BOLD_PURPLE",),
-        "*.ra": ("CYAN",),
-        "*.rar": ("BOLD_RED",),
-        "*.rm": ("BOLD_PURPLE",),
-        "*.rmvb": ("BOLD_PURPLE",),
-        "*.rpm": ("BOLD_RED",),
-        "*.rz": ("BOLD_RED",),
-        "*.sar": ("BOLD_RED",),
-        "*.spx": ("CYAN",),
-        "*.svg": ("BOLD_PURPLE",),
-        "*.svgz": ("BOLD_PURPLE",),
-        "*.swm": ("BOLD_RED",),
-        "*.t7z": ("BOLD_RED",),
-        "*.tar": ("BOLD_RED",),
-        "*.taz": ("BOLD_RED",),
-        "*.tbz": ("BOLD_RED",),
-        "*.tbz2": ("BOLD_RED",),
-        "*.tga": ("BOLD_PURPLE",),
-        "*.tgz": ("BOLD_RED",),
-        "*.tif": ("BOLD_PURPLE",),
-        "*.tiff": ("BOLD_PURPLE",),
-        "*.tlz": ("BOLD_RED",),
-        "*.txz": ("BOLD_RED",),
-        "*.tz": ("BOLD_RED",),
-        "*.tzo": ("BOLD_RED",),
-        "*.tzst": ("BOLD_RED",),
-        "*.vob": ("BOLD_PURPLE",),
-        "*.war": ("BOLD_RED",),
-        "*.wav": ("CYAN",),
-        "*.webm": ("BOLD_PURPLE",),
-        "*.wim": ("BOLD_RED",),
-        "*.wmv": ("BOLD_PURPLE",),
-        "*.xbm": ("BOLD_PURPLE",),
-        "*.xcf": ("BOLD_PURPLE",),
-        "*.xpm": ("BOLD_PURPLE",),
-        "*.xspf": ("CYAN",),
-        "*.xwd": ("BOLD_PURPLE",),
-        "*.xz": ("BOLD_RED",),
-        "*.yuv": ("BOLD_PURPLE",),
-        "*.z": ("BOLD_RED",),
-        "*.zip": ("BOLD_RED",),
-        "*.zoo": ("BOLD_RED",),
-        "*.zst": ("BOLD_RED",),
-        "bd": ("BACKGROUND_BLACK", "YELLOW"),
-        "ca": ("BLACK", "BACKGROUND_RED"),
-        "cd": ("BACKGROUND_BLACK", "YELLOW"),
-        "di": ("BOLD_BLUE",),
-        "do": ("BOLD_PURPLE",),
-        "ex": ("BOLD_GREEN",),
-        "ln": ("BOLD_CYAN",),
-        "mh": ("NO_COLOR",),
-        "mi": ("NO_COLOR",),
-        "or": ("BACKGROUND_BLACK", "RED"),
-        "ow": ("BLUE", "BACKGROUND_GREEN"),
-        "pi": ("BACKGROUND_BLACK", "YELLOW"),
-        "rs": ("NO_COLOR",),
-        "sg": ("BLACK", "BACKGROUND_YELLOW"),
-        "so": ("BOLD_PURPLE",),
-        "st": ("WHITE", "BACKGROUND_BLUE"),
-        "su": ("WHITE", "BACKGROUND_RED"),
-        "tw": ("BLACK", "BACKGROUND_GREEN"),
-    }
+    default_settings = types.MappingProxyType(_DEFAULT_LS_COLORS)
 
     def __init__(self, *args, **kwargs):
-        self._d = dict(*args, **kwargs)
-        self._style = self._style_name = None
+        super().__init__((k, tuple(v)) for k, v in dict(*args, **kwargs).items())
+        self._style = self._style_name = self._style_get = None
         self._detyped = None
-
-    def __getitem__(self, key):
-        return self._d[key]
+        # maps color name tuples to their escape codes in the current style
+        self._encoded = {}
+        # maps keys to their rendered "key=code" fragment in the current style
+        self._fragments = {}
 
     def __setitem__(self, key, value):
+        value = tuple(value)
+        if self.get(key) == value:
+            # unchanged, so the detyped string is still valid
+            return
         self._detyped = None
-        self._d[key] = value
+        self._fragments.pop(key, None)
+        super().__setitem__(key, value)
 
     def __delitem__(self, key):
         self._detyped = None
-        del self._d[key]
+        self._fragments.pop(key, None)
+        super().__delitem__(key)
 
-    def __len__(self):
-        return len(self._d)
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
 
-    def __iter__(self):
-        yield from self._d
+    def __reduce__(self):
+        # pickle would otherwise restore the items through __setitem__,
+        # before the caches it updates exist
+        return (type(self), (dict(self),))
+
+    def __ior__(self, other):
+        # dict's own in-place merge (Python 3.9+) would skip __setitem__
+        self.update(other)
+        return self
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *args):
+        self._detyped = None
+        self._fragments.pop(key, None)
+        return super().pop(key, *args)
+
+    def popitem(self):
+        self._detyped = None
+        key, value = super().popitem()
+        self._fragments.pop(key, None)
+        return key, value
+
+    def clear(self):
+        self._detyped = None
+        self._fragments.clear()
+        super().clear()
 
     def __str__(self):
-        return str(self._d)
+        return super().__repr__()
 
     def __repr__(self):
-        return "{0}.{1}(...)".format(
-            self.__class__.__module__, self.__class__.__name__, self._d
-        )
+        return "{0}.{1}(...)".format(self.__class__.__module__, self.__class__.__name__)
 
     def _repr_pretty_(self, p, cycle):
         name = "{0}.{1}".format(self.__class__.__module__, self.__class__.__name__)
@@ -360,14 +463,23 @@ class LsColors(cabc.MutableMapping):
 
     def detype(self):
         """De-types the instance, allowing it to be exported to the environment."""
-        style = self.style
+        self.style  # refreshes the style, if needed
         if self._detyped is None:
-            self._detyped = ":".join(
-                [
-                    key + "=" + ";".join([style[v] or "0" for v in val])
-                    for key, val in sorted(self._d.items())
-                ]
-            )
+            fragments = self._fragments
+            # fragments only ever holds current keys, so if the sizes match
+            # nothing needs to be rendered
+            if len(fragments) != len(self):
+                encoded = self._encoded
+                sget = self._style_get
+                for key, val in self.items():
+                    if key in fragments:
+                        continue
+                    code = encoded.get(val)
+                    if code is None:
+                        code = encoded[val] = ";".join([sget(v) or "0" for v in val])
+                    fragments[key] = key + "=" + code
+            # order does not matter to ls, so skip sorting the keys
+            self._detyped = ":".join(fragments.values())
         return self._detyped
 
     @property
@@ -375,9 +487,14 @@ class LsColors(cabc.MutableMapping):
         """Current XONSH_COLOR_STYLE value"""
         env = builtins.__xonsh__.env
         env_style_name = env.get("XONSH_COLOR_STYLE")
-        if self._style_name is None or self._style_name != env_style_name:
+        style_name = self._style_name
+        # the env hands back the same str object until the style is changed,
+        # so an identity check settles the common case without comparing
+        if style_name is not env_style_name and (
+            style_name is None or style_name != env_style_name
+        ):
             self._style_name = env_style_name
-            self._style = self._dtyped = None
+            self._style = self._detyped = None
         return self._style_name
 
     @property
@@ -386,7 +503,10 @@ class LsColors(cabc.MutableMapping):
         style_name = self.style_name
         if self._style is None:
             self._style = ansi_style_by_name(style_name)
+            self._style_get = self._style.get
             self._detyped = None
+            self._encoded.clear()
+            self._fragments.clear()
         return self._style
 
     @classmethod
@@ -394,47 +514,74 @@ class LsColors(cabc.MutableMapping):
         """Creates a new instance of the LsColors class from a colon-separated
         string of dircolor-valid keys to ANSI color escape sequences.
         """
-        obj = cls()
         # string inputs always use default codes, so translating into
         # xonsh names should be done from defaults
-        reversed_default = ansi_reverse_style(style="default")
+        reversed_default = DEFAULT_REVERSED_STYLE
+        # many keys share the same escape code, so only translate each once
+        names = {}
         data = {}
-        for item in s.split(":"):
-            key, eq, esc = item.partition("=")
-            if not eq:
-                # not a valid item
-                continue
-            data[key] = ansi_color_escape_code_to_name(
-                esc, "default", reversed_style=reversed_default
-            )
-        obj._d = data
-        return obj
+        for key, esc in LS_COLORS_ITEM_RE.findall(s):
+            name = names.get(esc)
+            if name is None:
+                name = names[esc] = ansi_color_escape_code_to_name(
+                    esc, "default", reversed_style=reversed_default
+                )
+            data[key] = name
+        return cls(data)
 
     @classmethod
     def fromdircolors(cls, filename=None):
         """Constructs an LsColors instance by running dircolors.
         If a filename is provided, it is passed down to the dircolors command.
         """
-        # assemble command
-        cmd = ["dircolors", "-b"]
+        # get env, dircolors only cares about the terminal and locale so
+        # there is no need to detype the whole environment
+        try:
+            env = builtins.__xonsh__.env
+        except AttributeError:
+            path = denv = None
+        else:
+            # the binary is looked up on the session's $PATH, which may
+            # differ from the process's
+            path = os.pathsep.join(env.get("PATH"))
+            denv = {
+                k: str(env[k]) for k in DIRCOLORS_ENV_VARS if env.is_manually_set(k)
+            }
+        # assemble command, skipping the spawn if there is nothing to run
+        dircolors = dircolors_path(path)
+        if dircolors is None:
+            return cls(_DEFAULT_LS_COLORS)
+        cmd = [dircolors, "-b"]
         if filename is not None:
             cmd.append(filename)
-        # get env
-        if hasattr(builtins, "__xonsh__") and hasattr(builtins.__xonsh__, "env"):
-            denv = builtins.__xonsh__.env.detype()
-        else:
-            denv = None
+        # reuse a previous run with the same inputs
+        key = (
+            dircolors,
+            filename,
+            None if denv is None else tuple(sorted(denv.items())),
+        )
+        if key in _DIRCOLORS_CACHE:
+            return cls(_DIRCOLORS_CACHE[key])
         # run dircolors
         try:
-            out = subprocess.check_output(
-                cmd, env=denv, universal_newlines=True, stderr=subprocess.DEVNULL
-            )
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return cls(cls.default_settings)
-        s = out.splitlines()[0]
-        _, _, s = s.partition("'")
-        s, _, _ = s.rpartition("'")
-        return cls.fromstring(s)
+            out = subprocess.run(
+                cmd,
+                env=denv,
+                universal_newlines=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=DIRCOLORS_TIMEOUT,
+                check=True,
+            ).stdout
+        except (subprocess.SubprocessError, FileNotFoundError):
+            return cls(_DEFAULT_LS_COLORS)
+        nl = out.find("\n")
+        line = out if nl < 0 else out[:nl]
+        m = DIRCOLORS_QUOTED_RE.search(line)
+        s = m.group(1) if m else ""
+        obj = cls.fromstring(s)
+        _DIRCOLORS_CACHE[key] = dict(obj)
+        return obj
 
     @classmethod
     def convert(cls, x):
@@ -454,14 +601,21 @@ def is_lscolors(x):
     return isinstance(x, LsColors)
 
 
+_LS_COLORS_ENSURED = False
+
+
 @events.on_pre_spec_run_ls
 def ensure_ls_colors_in_env(spec=None, **kwargs):
     """This ensures that the $LS_COLORS environment variable is in the
     environment. This fires exactly once upon the first time the
     ls command is called.
     """
+    global _LS_COLORS_ENSURED
+    if _LS_COLORS_ENSURED:
+        return
+    _LS_COLORS_ENSURED = True
     env = builtins.__xonsh__.env
-    if "LS_COLORS" not in env._d:
+    if not env.is_manually_set("LS_COLORS"):
         # this adds it to the env too
         default_lscolors(env)
     events.on_pre_spec_run_ls.discard(ensure_ls_colors_in_env)
@@ -471,125 +625,171 @@ def ensure_ls_colors_in_env(spec=None, **kwargs):
 # Ensurerers
 #
 
-Ensurer = collections.namedtuple("Ensurer", ["validate", "convert", "detype"])
-Ensurer.__doc__ = """Named tuples whose elements are functions that
-represent environment variable validation, conversion, detyping.
-"""
 
+class Ensurer(object):
+    """Holds the functions that represent environment variable validation,
+    conversion, and detyping. This may be unpacked like the 3-tuple it
+    used to be.
+    """
 
-@lazyobject
-def DEFAULT_ENSURERS():
-    return {
-        "AUTO_CD": (is_bool, to_bool, bool_to_str),
-        "AUTO_PUSHD": (is_bool, to_bool, bool_to_str),
-        "AUTO_SUGGEST": (is_bool, to_bool, bool_to_str),
-        "AUTO_SUGGEST_IN_COMPLETIONS": (is_bool, to_bool, bool_to_str),
-        "BASH_COMPLETIONS": (is_env_path, str_to_env_path, env_path_to_str),
-        "CASE_SENSITIVE_COMPLETIONS": (is_bool, to_bool, bool_to_str),
-        re.compile(r"\w*DIRS$"): (is_env_path, str_to_env_path, env_path_to_str),
-        "COLOR_INPUT": (is_bool, to_bool, bool_to_str),
-        "COLOR_RESULTS": (is_bool, to_bool, bool_to_str),
-        "COMPLETIONS_BRACKETS": (is_bool, to_bool, bool_to_str),
-        "COMPLETIONS_CONFIRM": (is_bool, to_bool, bool_to_str),
-        "COMPLETIONS_DISPLAY": (
-            is_completions_display_value,
-            to_completions_display_value,
-            str,
-        ),
-        "COMPLETIONS_MENU_ROWS": (is_int, int, str),
-        "COMPLETION_QUERY_LIMIT": (is_int, int, str),
-        "DIRSTACK_SIZE": (is_int, int, str),
-        "DOTGLOB": (is_bool, to_bool, bool_to_str),
-        "DYNAMIC_CWD_WIDTH": (
-            is_dynamic_cwd_width,
-            to_dynamic_cwd_tuple,
-            dynamic_cwd_tuple_to_str,
-        ),
-        "DYNAMIC_CWD_ELISION_CHAR": (is_string, ensure_string, ensure_string),
-        "EXPAND_ENV_VARS": (is_bool, to_bool, bool_to_str),
-        "FORCE_POSIX_PATHS": (is_bool, to_bool, bool_to_str),
-        "FOREIGN_ALIASES_SUPPRESS_SKIP_MESSAGE": (is_bool, to_bool, bool_to_str),
-        "FOREIGN_ALIASES_OVERRIDE": (is_bool, to_bool, bool_to_str),
-        "FUZZY_PATH_COMPLETION": (is_bool, to_bool, bool_to_str),
-        "GLOB_SORTED": (is_bool, to_bool, bool_to_str),
-        "HISTCONTROL": (is_string_set, csv_to_set, set_to_csv),
-        "IGNOREEOF": (is_bool, to_bool, bool_to_str),
-        "INTENSIFY_COLORS_ON_WIN": (
-            always_false,
-            intensify_colors_on_win_setter,
-            bool_to_str,
-        ),
-        "LANG": (is_string, ensure_string, ensure_string),
-        "LC_COLLATE": (always_false, locale_convert("LC_COLLATE"), ensure_string),
-        "LC_CTYPE": (always_false, locale_convert("LC_CTYPE"), ensure_string),
-        "LC_MESSAGES": (always_false, locale_convert("LC_MESSAGES"), ensure_string),
-        "LC_MONETARY": (always_false, locale_convert("LC_MONETARY"), ensure_string),
-        "LC_NUMERIC": (always_false, locale_convert("LC_NUMERIC"), ensure_string),
-        "LC_TIME": (always_false, locale_convert("LC_TIME"), ensure_string),
-        "LS_COLORS": (is_lscolors, LsColors.convert, detype),
-        "LOADED_RC_FILES": (is_bool_seq, csv_to_bool_seq, bool_seq_to_csv),
-        "MOUSE_SUPPORT": (is_bool, to_bool, bool_to_str),
-        "MULTILINE_PROMPT": (is_string_or_callable, ensure_string, ensure_string),
-        re.compile(r"\w*PATH$"): (is_env_path, str_to_env_path, env_path_to_str),
-        "PATHEXT": (
-            is_nonstring_seq_of_strings,
-            pathsep_to_upper_seq,
-            seq_to_upper_pathsep,
-        ),
-        "PRETTY_PRINT_RESULTS": (is_bool, to_bool, bool_to_str),
-        "PROMPT": (is_string_or_callable, ensure_string, ensure_string),
-        "PROMPT_FIELDS": (always_true, None, None),
-        "PROMPT_TOOLKIT_COLOR_DEPTH": (
-            always_false,
-            ptk2_color_depth_setter,
-            ensure_string,
-        ),
-        "PUSHD_MINUS": (is_bool, to_bool, bool_to_str),
-        "PUSHD_SILENT": (is_bool, to_bool, bool_to_str),
-        "PTK_STYLE_OVERRIDES": (is_str_str_dict, to_str_str_dict, dict_to_str),
-        "RAISE_SUBPROC_ERROR": (is_bool, to_bool, bool_to_str),
-        "RIGHT_PROMPT": (is_string_or_callable, ensure_string, ensure_string),
-        "BOTTOM_TOOLBAR": (is_string_or_callable, ensure_string, ensure_string),
-        "SUBSEQUENCE_PATH_COMPLETION": (is_bool, to_bool, bool_to_str),
-        "SUGGEST_COMMANDS": (is_bool, to_bool, bool_to_str),
-        "SUGGEST_MAX_NUM": (is_int, int, str),
-        "SUGGEST_THRESHOLD": (is_int, int, str),
-        "SUPPRESS_BRANCH_TIMEOUT_MESSAGE": (is_bool, to_bool, bool_to_str),
-        "UPDATE_COMPLETIONS_ON_KEYPRESS": (is_bool, to_bool, bool_to_str),
-        "UPDATE_OS_ENVIRON": (is_bool, to_bool, bool_to_str),
-        "UPDATE_PROMPT_ON_KEYPRESS": (is_bool, to_bool, bool_to_str),
-        "VC_BRANCH_TIMEOUT": (is_float, float, str),
-        "VC_HG_SHOW_BRANCH": (is_bool, to_bool, bool_to_str),
-        "VI_MODE": (is_bool, to_bool, bool_to_str),
-        "VIRTUAL_ENV": (is_string, ensure_string, ensure_string),
-        "WIN_UNICODE_CONSOLE": (always_false, setup_win_unicode_console, bool_to_str),
-        "XONSHRC": (is_env_path, str_to_env_path, env_path_to_str),
-        "XONSH_APPEND_NEWLINE": (is_bool, to_bool, bool_to_str),
-        "XONSH_AUTOPAIR": (is_bool, to_bool, bool_to_str),
-        "XONSH_CACHE_SCRIPTS": (is_bool, to_bool, bool_to_str),
-        "XONSH_CACHE_EVERYTHING": (is_bool, to_bool, bool_to_str),
-        "XONSH_COLOR_STYLE": (is_string, ensure_string, ensure_string),
-        "XONSH_DEBUG": (always_false, to_debug, bool_or_int_to_str),
-        "XONSH_ENCODING": (is_string, ensure_string, ensure_string),
-        "XONSH_ENCODING_ERRORS": (is_string, ensure_string, ensure_string),
-        "XONSH_HISTORY_BACKEND": (is_history_backend, to_itself, ensure_string),
-        "XONSH_HISTORY_FILE": (is_string, ensure_string, ensure_string),
-        "XONSH_HISTORY_MATCH_ANYWHERE": (is_bool, to_bool, bool_to_str),
-        "XONSH_HISTORY_SIZE": (
-            is_history_tuple,
-            to_history_tuple,
-            history_tuple_to_str,
-        ),
-        "XONSH_LOGIN": (is_bool, to_bool, bool_to_str),
-        "XONSH_PROC_FREQUENCY": (is_float, float, str),
-        "XONSH_SHOW_TRACEBACK": (is_bool, to_bool, bool_to_str),
-        "XONSH_STDERR_PREFIX": (is_string, ensure_string, ensure_string),
-        "XONSH_STDERR_POSTFIX": (is_string, ensure_string, ensure_string),
-        "XONSH_STORE_STDOUT": (is_bool, to_bool, bool_to_str),
-        "XONSH_STORE_STDIN": (is_bool, to_bool, bool_to_str),
-        "XONSH_TRACEBACK_LOGFILE": (is_logfile_opt, to_logfile_opt, logfile_opt_to_str),
-        "XONSH_DATETIME_FORMAT": (is_string, ensure_string, ensure_string),
-    }
+    __slots__ = ("validate", "convert", "detype")
+
+    def __init__(self, validate, convert, detype):
+        self.validate = validate
+        self.convert = convert
+        self.detype = detype
+
+    def __iter__(self):
+        yield self.validate
+        yield self.convert
+        yield self.detype
+
+    def __eq__(self, other):
+        if not isinstance(other, Ensurer):
+            return NotImplemented
+        return tuple(self) == tuple(other)
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        return "Ensurer(validate={0!r}, convert={1!r}, detype={2!r})".format(
+            self.validate, self.convert, self.detype
+        )
+
+
+# ensurers shared by many environment variables
+_BOOL_ENSURER = Ensurer(is_bool, to_bool, bool_to_str)
+_PATH_ENSURER = Ensurer(is_env_path, str_to_env_path, env_path_to_str)
+_INT_ENSURER = Ensurer(is_int, int, str)
+_FLOAT_ENSURER = Ensurer(is_float, float, str)
+_STRING_ENSURER = Ensurer(is_string, ensure_string, ensure_string)
+_STRING_OR_CALLABLE_ENSURER = Ensurer(
+    is_string_or_callable, ensure_string, ensure_string
+)
+
+# ensurers for any variable whose name is a word ending in these suffixes
+SUFFIX_ENSURERS = (("DIRS", _PATH_ENSURER), ("PATH", _PATH_ENSURER))
+_SUFFIXES = tuple(suffix for suffix, _ in SUFFIX_ENSURERS)
+
+
+_DEFAULT_ENSURERS = {
+    "AUTO_CD": _BOOL_ENSURER,
+    "AUTO_PUSHD": _BOOL_ENSURER,
+    "AUTO_SUGGEST": _BOOL_ENSURER,
+    "AUTO_SUGGEST_IN_COMPLETIONS": _BOOL_ENSURER,
+    "BASH_COMPLETIONS": _PATH_ENSURER,
+    "CASE_SENSITIVE_COMPLETIONS": _BOOL_ENSURER,
+    "COLOR_INPUT": _BOOL_ENSURER,
+    "COLOR_RESULTS": _BOOL_ENSURER,
+    "COMPLETIONS_BRACKETS": _BOOL_ENSURER,
+    "COMPLETIONS_CONFIRM": _BOOL_ENSURER,
+    "COMPLETIONS_DISPLAY": Ensurer(
+        is_completions_display_value, to_completions_display_value, str
+    ),
+    "COMPLETIONS_MENU_ROWS": _INT_ENSURER,
+    "COMPLETION_QUERY_LIMIT": _INT_ENSURER,
+    "DIRSTACK_SIZE": _INT_ENSURER,
+    "DOTGLOB": _BOOL_ENSURER,
+    "DYNAMIC_CWD_WIDTH": Ensurer(
+        is_dynamic_cwd_width, to_dynamic_cwd_tuple, dynamic_cwd_tuple_to_str
+    ),
+    "DYNAMIC_CWD_ELISION_CHAR": _STRING_ENSURER,
+    "EXPAND_ENV_VARS": _BOOL_ENSURER,
+    "FORCE_POSIX_PATHS": _BOOL_ENSURER,
+    "FOREIGN_ALIASES_SUPPRESS_SKIP_MESSAGE": _BOOL_ENSURER,
+    "FOREIGN_ALIASES_OVERRIDE": _BOOL_ENSURER,
+    "FUZZY_PATH_COMPLETION": _BOOL_ENSURER,
+    "GLOB_SORTED": _BOOL_ENSURER,
+    "HISTCONTROL": Ensurer(is_string_set, csv_to_set, set_to_csv),
+    "IGNOREEOF": _BOOL_ENSURER,
+    "INTENSIFY_COLORS_ON_WIN": Ensurer(
+        always_false, intensify_colors_on_win_setter, bool_to_str
+    ),
+    "LANG": _STRING_ENSURER,
+    "LC_COLLATE": Ensurer(always_false, locale_convert("LC_COLLATE"), ensure_string),
+    "LC_CTYPE": Ensurer(always_false, locale_convert("LC_CTYPE"), ensure_string),
+    "LC_MESSAGES": Ensurer(always_false, locale_convert("LC_MESSAGES"), ensure_string),
+    "LC_MONETARY": Ensurer(always_false, locale_convert("LC_MONETARY"), ensure_string),
+    "LC_NUMERIC": Ensurer(always_false, locale_convert("LC_NUMERIC"), ensure_string),
+    "LC_TIME": Ensurer(always_false, locale_convert("LC_TIME"), ensure_string),
+    "LS_COLORS": Ensurer(is_lscolors, LsColors.convert, detype),
+    "LOADED_RC_FILES": Ensurer(is_bool_seq, csv_to_bool_seq, bool_seq_to_csv),
+    "MOUSE_SUPPORT": _BOOL_ENSURER,
+    "MULTILINE_PROMPT": _STRING_OR_CALLABLE_ENSURER,
+    "PATHEXT": Ensurer(
+        is_nonstring_seq_of_strings, pathsep_to_upper_seq, seq_to_upper_pathsep
+    ),
+    "PRETTY_PRINT_RESULTS": _BOOL_ENSURER,
+    "PROMPT": _STRING_OR_CALLABLE_ENSURER,
+    "PROMPT_FIELDS": Ensurer(always_true, None, None),
+    "PROMPT_TOOLKIT_COLOR_DEPTH": Ensurer(
+        always_false, ptk2_color_depth_setter, ensure_string
+    ),
+    "PUSHD_MINUS": _BOOL_ENSURER,
+    "PUSHD_SILENT": _BOOL_ENSURER,
+    "PTK_STYLE_OVERRIDES": Ensurer(is_str_str_dict, to_str_str_dict, dict_to_str),
+    "RAISE_SUBPROC_ERROR": _BOOL_ENSURER,
+    "RIGHT_PROMPT": _STRING_OR_CALLABLE_ENSURER,
+    "BOTTOM_TOOLBAR": _STRING_OR_CALLABLE_ENSURER,
+    "SUBSEQUENCE_PATH_COMPLETION": _BOOL_ENSURER,
+    "SUGGEST_COMMANDS": _BOOL_ENSURER,
+    "SUGGEST_MAX_NUM": _INT_ENSURER,
+    "SUGGEST_THRESHOLD": _INT_ENSURER,
+    "SUPPRESS_BRANCH_TIMEOUT_MESSAGE": _BOOL_ENSURER,
+    "UPDATE_COMPLETIONS_ON_KEYPRESS": _BOOL_ENSURER,
+    "UPDATE_OS_ENVIRON": _BOOL_ENSURER,
+    "UPDATE_PROMPT_ON_KEYPRESS": _BOOL_ENSURER,
+    "VC_BRANCH_TIMEOUT": _FLOAT_ENSURER,
+    "VC_HG_SHOW_BRANCH": _BOOL_ENSURER,
+    "VI_MODE": _BOOL_ENSURER,
+    "VIRTUAL_ENV": _STRING_ENSURER,
+    "WIN_UNICODE_CONSOLE": Ensurer(
+        always_false, setup_win_unicode_console, bool_to_str
+    ),
+    "XONSHRC": _PATH_ENSURER,
+    "XONSH_APPEND_NEWLINE": _BOOL_ENSURER,
+    "XONSH_AUTOPAIR": _BOOL_ENSURER,
+    "XONSH_CACHE_SCRIPTS": _BOOL_ENSURER,
+    "XONSH_CACHE_EVERYTHING": _BOOL_ENSURER,
+    "XONSH_COLOR_STYLE": _STRING_ENSURER,
+    "XONSH_DEBUG": Ensurer(always_false, to_debug, bool_or_int_to_str),
+    "XONSH_ENCODING": _STRING_ENSURER,
+    "XONSH_ENCODING_ERRORS": _STRING_ENSURER,
+    "XONSH_HISTORY_BACKEND": Ensurer(is_history_backend, to_itself, ensure_string),
+    "XONSH_HISTORY_FILE": _STRING_ENSURER,
+    "XONSH_HISTORY_MATCH_ANYWHERE": _BOOL_ENSURER,
+    "XONSH_HISTORY_SIZE": Ensurer(
+        is_history_tuple, to_history_tuple, history_tuple_to_str
+    ),
+    "XONSH_LOGIN": _BOOL_ENSURER,
+    "XONSH_PROC_FREQUENCY": _FLOAT_ENSURER,
+    "XONSH_SHOW_TRACEBACK": _BOOL_ENSURER,
+    "XONSH_STDERR_PREFIX": _STRING_ENSURER,
+    "XONSH_STDERR_POSTFIX": _STRING_ENSURER,
+    "XONSH_STORE_STDOUT": _BOOL_ENSURER,
+    "XONSH_STORE_STDIN": _BOOL_ENSURER,
+    "XONSH_TRACEBACK_LOGFILE": Ensurer(
+        is_logfile_opt, to_logfile_opt, logfile_opt_to_str
+    ),
+    "XONSH_DATETIME_FORMAT": _STRING_ENSURER,
+}
+# read-only, since each Env copies the lookup tables built from it below
+DEFAULT_ENSURERS = types.MappingProxyType(_DEFAULT_ENSURERS)
+
+
+# DEFAULT_ENSURERS split once into exact names and regex patterns, so that
+# each Env only has to copy them
+_EXACT_ENSURERS = {k: v for k, v in DEFAULT_ENSURERS.items() if isinstance(k, str)}
+_PATTERN_ENSURERS = [
+    (k, v) for k, v in DEFAULT_ENSURERS.items() if not isinstance(k, str)
+]
+
+
+def _is_word(s):
+    """Checks that a string only has word characters, like the regex ``\\w*``."""
+    # identifiers cannot start with a digit, but word characters can
+    return not s or s.isidentifier() or ("_" + s).isidentifier()
 
 
 #
@@ -606,23 +806,42 @@ def is_callable_default(x):
     return callable(x) and getattr(x, "_xonsh_callable_default", False)
 
 
+def locale_default(key):
+    """Creates a callable default that reports the current setting of a
+    locale category, so that libc is only queried when the variable is read.
+    """
+
+    @default_value
+    def lc_default(env):
+        return locale.setlocale(LOCALE_CATS[key])
+
+    return lc_default
+
+
 DEFAULT_TITLE = "{current_job:{} | }{user}@{hostname}: {cwd} | xonsh"
 
 
+def _ensure_xdg_child(base, sub):
+    """Ensures and returns a subdirectory of an XDG base directory. The
+    directory is only created when it is missing, so that it is remade if
+    it is removed during the session.
+    """
+    path = os.path.expanduser(os.path.join(base, sub))
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
+    return path
+
+
 @default_value
 def xonsh_data_dir(env):
     """Ensures and returns the $XONSH_DATA_DIR"""
-    xdd = os.path.expanduser(os.path.join(env.get("XDG_DATA_HOME"), "xonsh"))
-    os.makedirs(xdd, exist_ok=True)
-    return xdd
+    return _ensure_xdg_child(env.get("XDG_DATA_HOME"), "xonsh")
 
 
 @default_value
 def xonsh_config_dir(env):
     """Ensures and returns the $XONSH_CONFIG_DIR"""
-    xcd = os.path.expanduser(os.path.join(env.get("XDG_CONFIG_HOME"), "xonsh"))
-    os.makedirs(xcd, exist_ok=True)
-    return xcd
+    return _ensure_xdg_child(env.get("XDG_CONFIG_HOME"), "xonsh")
 
 
 def xonshconfig(env):
@@ -675,6 +894,15 @@ def default_lscolors(env):
     return lsc
 
 
+@default_value
+def default_prompt_fields(env):
+    """Creates a new copy of the default prompt fields"""
+    fields = dict(prompt.PROMPT_FIELDS)
+    # have to place this in the env, so that changes to it are kept
+    env["PROMPT_FIELDS"] = fields
+    return fields
+
+
 # Default values should generally be immutable, that way if a user wants
 # to set them they have to do a copy and write them to the environment.
 # try to keep this sorted.
@@ -703,7 +931,7 @@ def DEFAULT_VALUES():
         "FORCE_POSIX_PATHS": False,
         "FOREIGN_ALIASES_SUPPRESS_SKIP_MESSAGE": False,
         "FOREIGN_ALIASES_OVERRIDE": False,
-        "PROMPT_FIELDS": dict(prompt.PROMPT_FIELDS),
+        "PROMPT_FIELDS": default_prompt_fields,
         "FUZZY_PATH_COMPLETION": True,
         "GLOB_SORTED": True,
         "HISTCONTROL": set(),
@@ -711,11 +939,11 @@ def DEFAULT_VALUES():
         "INDENT": "    ",
         "INTENSIFY_COLORS_ON_WIN": True,
         "LANG": "C.UTF-8",
-        "LC_CTYPE": locale.setlocale(locale.LC_CTYPE),
-        "LC_COLLATE": locale.setlocale(locale.LC_COLLATE),
-        "LC_TIME": locale.setlocale(locale.LC_TIME),
-        "LC_MONETARY": locale.setlocale(locale.LC_MONETARY),
-        "LC_NUMERIC": locale.setlocale(locale.LC_NUMERIC),
+        "LC_CTYPE": locale_default("LC_CTYPE"),
+        "LC_COLLATE": locale_default("LC_COLLATE"),
+        "LC_TIME": locale_default("LC_TIME"),
+        "LC_MONETARY": locale_default("LC_MONETARY"),
+        "LC_NUMERIC": locale_default("LC_NUMERIC"),
         "LS_COLORS": default_lscolors,
         "LOADED_RC_FILES": (),
         "MOUSE_SUPPORT": False,
@@ -773,7 +1001,7 @@ def DEFAULT_VALUES():
         "XONSH_DATETIME_FORMAT": "%Y-%m-%d %H:%M",
     }
     if hasattr(locale, "LC_MESSAGES"):
-        dv["LC_MESSAGES"] = locale.setlocale(locale.LC_MESSAGES)
+        dv["LC_MESSAGES"] = locale_default("LC_MESSAGES")
     return dv
 
 
@@ -1328,7 +1556,9 @@ class Env(cabc.MutableMapping):
         # sentinel value for non existing envvars
         self._no_value = object()
         self._orig_env = None
-        self._ensurers = {k: Ensurer(*v) for k, v in DEFAULT_ENSURERS.items()}
+        self._ensurers = dict(_EXACT_ENSURERS)
+        # regex-keyed ensurers, kept apart so misses only scan these
+        self._pattern_ensurers = list(_PATTERN_ENSURERS)
         self._defaults = DEFAULT_VALUES
         self._docs = DEFAULT_DOCS
         if len(args) == 0 and len(kwargs) == 0:
@@ -1393,13 +1623,17 @@ class Env(cabc.MutableMapping):
         """Gets an ensurer for the given key."""
         if key in self._ensurers:
             return self._ensurers[key]
-        for k, ensurer in self._ensurers.items():
-            if isinstance(k, str):
-                continue
-            if k.match(key) is not None:
+        # one C-level endswith() rules out most names up front
+        suffixes = SUFFIX_ENSURERS if key.endswith(_SUFFIXES) else ()
+        for suffix, ensurer in suffixes:
+            if key.endswith(suffix) and _is_word(key[: -len(suffix)]):
                 break
         else:
-            ensurer = self._get_default_ensurer(default=default)
+            for k, ensurer in self._pattern_ensurers:
+                if k.match(key) is not None:
+                    break
+            else:
+                ensurer = self._get_default_ensurer(default=default)
         self._ensurers[key] = ensurer
         return ensurer
 
@@ -1407,6 +1641,11 @@ class Env(cabc.MutableMapping):
         """Sets an ensurer."""
         self._detyped = None
         self._ensurers[key] = value
+        if not isinstance(key, str):
+            self._pattern_ensurers = [
+                (k, v) for k, v in self._pattern_ensurers if k != key
+            ]
+            self._pattern_ensurers.append((key, value))
 
     def get_docs(self, key, default=VarDocs("<no documentation>")):
         """Gets the documentation for the environment variable."""
@@ -1494,8 +1733,16 @@ class Env(cabc.MutableMapping):
         return val
 
     def __setitem__(self, key, val):
+        if type(key) is str:
+            # stored names hit the identity fast path when looked up with
+            # the (interned) literals used throughout xonsh
+            key = sys.intern(key)
         ensurer = self.get_ensurer(key)
-        if not ensurer.validate(val):
+        if ensurer is _BOOL_ENSURER or ensurer is _STRING_ENSURER:
+            # these converters pass valid values through unchanged, so there
+            # is no need to validate first
+            val = ensurer.convert(val)
+        elif not ensurer.validate(val):
             val = ensurer.convert(val)
         # existing envvars can have any value including None
         old_value = self._d[key] if key in self._d else self._no_value
@@ -1543,9 +1790,7 @@ class Env(cabc.MutableMapping):
         return str(self._d)
 
     def __repr__(self):
-        return "{0}.{1}(...)".format(
-            self.__class__.__module__, self.__class__.__name__, self._d
-        )
+        return "{0}.{1}(...)".format(self.__class__.__module__, self.__class__.__name__)
 
     def _repr_pretty_(self, p, cycle):
         name = "{0}.{1}".format(self.__class__.__module__, self.__class__.__name__)
@@ -1579,7 +1824,7 @@ def locate_binary(name):
 BASE_ENV = LazyObject(
     lambda: {
         "BASH_COMPLETIONS": list(DEFAULT_VALUES["BASH_COMPLETIONS"]),
-        "PROMPT_FIELDS": dict(DEFAULT_VALUES["PROMPT_FIELDS"]),
+        "PROMPT_FIELDS": dict(prompt.PROMPT_FIELDS),
         "XONSH_VERSION": XONSH_VERSION,
     },
     globals(),
@@ -16,17 +16,31 @@ from xonsh.tools import print_exception
 
 
 def has_kwargs(func):
+    # plain functions and methods flag **kwargs on their code object, which is
+    # far cheaper to check than building a full signature
+    if (inspect.isfunction(func) or inspect.ismethod(func)) and not hasattr(
+        func, "__wrapped__"
+    ):
+        return bool(func.__code__.co_flags & inspect.CO_VARKEYWORDS)
     return any(
         p.kind == p.VAR_KEYWORD for p in inspect.signature(func).parameters.values()
     )
 
 
 def debug_level():
-    if hasattr(builtins, "__xonsh__") and hasattr(builtins.__xonsh__, "env"):
-        return builtins.__xonsh__.env.get("XONSH_DEBUG")
-    # FIXME: Under py.test, return 1(?)
-    else:
+    try:
+        env = builtins.__xonsh__.env
+    except AttributeError:
+        # FIXME: Under py.test, return 1(?)
         return 0  # Optimize for speed, not guaranteed correctness
+    return env.get("XONSH_DEBUG")
+
+
+# Whether any handler has ever been given a validator. Until one is, firing
+# an event can skip filtering its handlers. This is global, rather than per
+# event, since validators are stored on the handlers, which may be registered
+# with more than one event.
+_HAS_VALIDATORS = False
 
 
 class AbstractEvent(collections.abc.MutableSet, abc.ABC):
@@ -67,8 +81,9 @@ class AbstractEvent(collections.abc.MutableSet, abc.ABC):
         rtn : callable
             The handler
         """
-        #  Using Python's "private" munging to minimize hypothetical collisions
-        handler.__validator = None
+        # prefixed to minimize hypothetical collisions, like the callable
+        # default flag in xonsh.environ
+        handler._xonsh_validator = None
         if debug_level():
             if not has_kwargs(handler):
                 raise ValueError("Event handlers need a **kwargs for future proofing")
@@ -83,7 +98,9 @@ class AbstractEvent(collections.abc.MutableSet, abc.ABC):
                     raise ValueError(
                         "Event validators need a **kwargs for future proofing"
                     )
-            handler.__validator = vfunc
+            global _HAS_VALIDATORS
+            _HAS_VALIDATORS = True
+            handler._xonsh_validator = vfunc
 
         handler.validator = validator
 
@@ -94,7 +111,8 @@ class AbstractEvent(collections.abc.MutableSet, abc.ABC):
         Helper method for implementing classes. Generates the handlers that pass validation.
         """
         for handler in handlers:
-            if handler.__validator is not None and not handler.__validator(**kwargs):
+            validator = handler._xonsh_validator
+            if validator is not None and not validator(**kwargs):
                 continue
             yield handler
 
@@ -117,20 +135,33 @@ class Event(AbstractEvent):
 
     # Wish I could just pull from set...
     def __init__(self):
-        self._handlers = set()
+        # handlers are kept in a list, which is cheap to iterate when firing,
+        # along with a set of the same handlers for membership tests
+        self._handlers = []
+        self._handler_set = set()
         self._firing = False
-        self._delayed_adds = None
-        self._delayed_discards = None
+        # (method, handler) pairs to apply, in order, once firing is done
+        self._delayed_ops = None
 
     def __len__(self):
         return len(self._handlers)
 
     def __contains__(self, item):
-        return item in self._handlers
+        return item in self._handler_set
 
     def __iter__(self):
         yield from self._handlers
 
+    def _add_handler(self, item):
+        if item not in self._handler_set:
+            self._handler_set.add(item)
+            self._handlers.append(item)
+
+    def _discard_handler(self, item):
+        if item in self._handler_set:
+            self._handler_set.discard(item)
+            self._handlers.remove(item)
+
     def add(self, item):
         """
         Add an element to a set.
@@ -138,11 +169,9 @@ class Event(AbstractEvent):
         This has no effect if the element is already present.
         """
         if self._firing:
-            if self._delayed_adds is None:
-                self._delayed_adds = set()
-            self._delayed_adds.add(item)
+            self._delay(self._add_handler, item)
         else:
-            self._handlers.add(item)
+            self._add_handler(item)
 
     def discard(self, item):
         """
@@ -151,11 +180,14 @@ class Event(AbstractEvent):
         If the element is not a member, do nothing.
         """
         if self._firing:
-            if self._delayed_discards is None:
-                self._delayed_discards = set()
-            self._delayed_discards.add(item)
+            self._delay(self._discard_handler, item)
         else:
-            self._handlers.discard(item)
+            self._discard_handler(item)
+
+    def _delay(self, op, item):
+        if self._delayed_ops is None:
+            self._delayed_ops = []
+        self._delayed_ops.append((op, item))
 
     def fire(self, **kwargs):
         """
@@ -175,9 +207,16 @@ class Event(AbstractEvent):
             Return values of each handler. If multiple handlers return the same value, it will
             appear multiple times.
         """
+        if not self._handlers:
+            # most events have no handlers, so skip the firing bookkeeping
+            return []
         vals = []
         self._firing = True
-        for handler in self._filterhandlers(self._handlers, **kwargs):
+        if _HAS_VALIDATORS:
+            handlers = self._filterhandlers(self._handlers, **kwargs)
+        else:
+            handlers = self._handlers
+        for handler in handlers:
             try:
                 rv = handler(**kwargs)
             except Exception:
@@ -186,12 +225,10 @@ class Event(AbstractEvent):
                 vals.append(rv)
         # clean up
         self._firing = False
-        if self._delayed_adds is not None:
-            self._handlers.update(self._delayed_adds)
-            self._delayed_adds = None
-        if self._delayed_discards is not None:
-            self._handlers.difference_update(self._delayed_discards)
-            self._delayed_discards = None
+        if self._delayed_ops is not None:
+            for op, item in self._delayed_ops:
+                op(item)
+            self._delayed_ops = None
         return vals
 
 
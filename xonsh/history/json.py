@@ -20,12 +20,14 @@ def _xhj_gc_commands_to_rmfiles(hsize, files):
     rmfiles = []
     n = 0
     ncmds = 0
-    for ts, fcmds, f in files[::-1]:
-        if fcmds == 0:
-            # we need to make sure that 'empty' history files don't hang around
-            rmfiles.append((ts, fcmds, f))
+    for ts, fcmds, f in reversed(files):
         if ncmds + fcmds > hsize:
             break
+        if fcmds == 0:
+            # we need to make sure that 'empty' history files don't hang
+            # around; only kept files are checked here, since all of the
+            # older ones are removed below anyway
+            rmfiles.append((ts, fcmds, f))
         ncmds += fcmds
         n += 1
     rmfiles += files[:-n]
@@ -54,7 +56,7 @@ def _xhj_gc_bytes_to_rmfiles(hsize, files):
     rmfiles = []
     n = 0
     nbytes = 0
-    for _, _, f in files[::-1]:
+    for _, _, f in reversed(files):
         fsize = os.stat(f).st_size
         if nbytes + fsize > hsize:
             break
@@ -71,23 +73,41 @@ def _xhj_get_history_files(sort=True, newest_first=False):
     data_dir = builtins.__xonsh__.env.get("XONSH_DATA_DIR")
     data_dir = xt.expanduser_abs_path(data_dir)
     try:
-        files = [
-            os.path.join(data_dir, f)
-            for f in os.listdir(data_dir)
-            if f.startswith("xonsh-") and f.endswith(".json")
+        entries = [
+            e
+            for e in os.scandir(data_dir)
+            if e.name.startswith("xonsh-") and e.name.endswith(".json")
         ]
     except OSError:
-        files = []
+        entries = []
         if builtins.__xonsh__.env.get("XONSH_DEBUG"):
             xt.print_exception("Could not collect xonsh history files.")
     if sort:
-        files.sort(key=lambda x: os.path.getmtime(x), reverse=newest_first)
-    return files
+        # the directory entries cache their stat results (and on Windows
+        # they come for free with the listing)
+        entries.sort(key=_xhj_entry_mtime, reverse=newest_first)
+    return [e.path for e in entries]
+
+
+def _xhj_entry_mtime(entry):
+    """Sort key for history file directory entries, by modify time."""
+    try:
+        return entry.stat().st_mtime
+    except OSError:
+        return 0.0
 
 
 class JsonHistoryGC(threading.Thread):
     """Shell history garbage collection."""
 
+    # maps history size units to the functions choosing the files to remove
+    gc_units_to_rmfiles = {
+        "commands": _xhj_gc_commands_to_rmfiles,
+        "files": _xhj_gc_files_to_rmfiles,
+        "s": _xhj_gc_seconds_to_rmfiles,
+        "b": _xhj_gc_bytes_to_rmfiles,
+    }
+
     def __init__(self, wait_for_shell=True, size=None, *args, **kwargs):
         """Thread responsible for garbage collecting old history.
 
@@ -96,18 +116,26 @@ class JsonHistoryGC(threading.Thread):
         super().__init__(*args, **kwargs)
         self.daemon = True
         self.size = size
+        self._shell_ready = threading.Event()
         self.wait_for_shell = wait_for_shell
         self.start()
-        self.gc_units_to_rmfiles = {
-            "commands": _xhj_gc_commands_to_rmfiles,
-            "files": _xhj_gc_files_to_rmfiles,
-            "s": _xhj_gc_seconds_to_rmfiles,
-            "b": _xhj_gc_bytes_to_rmfiles,
-        }
+
+    @property
+    def wait_for_shell(self):
+        """Whether the garbage collector is still waiting for the shell to
+        start. Setting this to False lets it run.
+        """
+        return not self._shell_ready.is_set()
+
+    @wait_for_shell.setter
+    def wait_for_shell(self, value):
+        if value:
+            self._shell_ready.clear()
+        else:
+            self._shell_ready.set()
 
     def run(self):
-        while self.wait_for_shell:
-            time.sleep(0.01)
+        self._shell_ready.wait()
         env = builtins.__xonsh__.env  # pylint: disable=no-member
         if self.size is None:
             hsize, units = env.get("XONSH_HISTORY_SIZE")
@@ -131,9 +159,8 @@ class JsonHistoryGC(threading.Thread):
         This is sorted by the last closed time. Returns a list of
         (timestamp, number of cmds, file name) tuples.
         """
-        # pylint: disable=no-member
-        env = getattr(builtins, "__xonsh__.env", None)
-        if env is None:
+        xsh = getattr(builtins, "__xonsh__", None)
+        if getattr(xsh, "env", None) is None:
             return []
         boot = uptime.boottime()
         fs = _xhj_get_history_files(sort=False)
@@ -153,8 +180,13 @@ class JsonHistoryGC(threading.Thread):
                     hist["locked"] = False
                     with open(f, "w", newline="\n") as fp:
                         xlj.ljdump(hist, fp, sort_keys=True)
-                    lj = xlj.LazyJSON(f, reopen=False)
+                    # the whole history is already loaded, so there is no
+                    # need to reopen the file to read its info
+                    ts = hist["ts"]
+                    files.append((ts[1] or ts[0], len(hist["cmds"]), f))
+                    continue
                 if only_unlocked and lj["locked"]:
+                    lj.close()
                     continue
                 # info: closing timestamp, number of commands, filename
                 files.append((lj["ts"][1] or lj["ts"][0], len(lj.sizes["cmds"]) - 1, f))
@@ -207,17 +239,20 @@ class JsonHistoryFlusher(threading.Thread):
                 continue
             cmds.append(cmd)
             last_inp = cmd["inp"]
-        with open(self.filename, "r", newline="\n") as f:
+        # read and rewrite through a single handle, rather than opening the
+        # file once for each
+        with open(self.filename, "r+", newline="\n") as f:
             hist = xlj.LazyJSON(f).load()
-        load_hist_len = len(hist["cmds"])
-        hist["cmds"].extend(cmds)
-        if self.at_exit:
-            hist["ts"][1] = time.time()  # apply end time
-            hist["locked"] = False
-        if not builtins.__xonsh__.env.get("XONSH_STORE_STDOUT", False):
-            [cmd.pop("out") for cmd in hist["cmds"][load_hist_len:] if "out" in cmd]
-        with open(self.filename, "w", newline="\n") as f:
+            load_hist_len = len(hist["cmds"])
+            hist["cmds"].extend(cmds)
+            if self.at_exit:
+                hist["ts"][1] = time.time()  # apply end time
+                hist["locked"] = False
+            if not builtins.__xonsh__.env.get("XONSH_STORE_STDOUT", False):
+                [cmd.pop("out") for cmd in hist["cmds"][load_hist_len:] if "out" in cmd]
+            f.seek(0)
             xlj.ljdump(hist, f, sort_keys=True)
+            f.truncate()
 
 
 class JsonCommandField(cabc.Sequence):
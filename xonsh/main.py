@@ -13,17 +13,13 @@ from xonsh import __version__
 from xonsh.timings import setup_timings
 from xonsh.lazyasd import lazyobject
 from xonsh.shell import Shell
-from xonsh.pretty import pretty
-from xonsh.execer import Execer
 from xonsh.proc import HiddenCommandPipeline
 from xonsh.jobs import ignore_sigtstp
 from xonsh.tools import setup_win_unicode_console, print_color, to_bool_or_int
 from xonsh.platform import HAS_PYGMENTS, ON_WINDOWS
 from xonsh.codecache import run_script_with_cache, run_code_with_cache
-from xonsh.xonfig import print_welcome_screen
 from xonsh.xontribs import xontribs_load
 from xonsh.lazyimps import pygments, pyghooks
-from xonsh.imphooks import install_import_hooks
 from xonsh.events import events
 from xonsh.environ import xonshrc_context, make_args_env
 from xonsh.built_ins import XonshSession, load_builtins, load_proxies
@@ -245,6 +241,13 @@ def parser():
     return p
 
 
+@lazyobject
+def _displayhook_lexer():
+    # building a XonshLexer checks the commands cache, so share one instance
+    # across displayed values rather than making a new one for each
+    return pyghooks.XonshLexer()
+
+
 def _pprint_displayhook(value):
     if value is None:
         return
@@ -254,11 +257,13 @@ def _pprint_displayhook(value):
         return
     env = builtins.__xonsh__.env
     if env.get("PRETTY_PRINT_RESULTS"):
+        from xonsh.pretty import pretty  # lazy import
+
         printed_val = pretty(value)
     else:
         printed_val = repr(value)
     if HAS_PYGMENTS and env.get("COLOR_RESULTS"):
-        tokens = list(pygments.lex(printed_val, lexer=pyghooks.XonshLexer()))
+        tokens = list(pygments.lex(printed_val, lexer=_displayhook_lexer))
         end = "" if env.get("SHELL_TYPE") == "prompt_toolkit2" else "\n"
         print_color(tokens, end=end)
     else:
@@ -277,6 +282,9 @@ def start_services(shell_kwargs, args):
     """Starts up the essential services in the proper order.
     This returns the environment instance as a convenience.
     """
+    from xonsh.execer import Execer  # lazy import
+    from xonsh.imphooks import install_import_hooks  # lazy import
+
     install_import_hooks()
     # create execer, which loads builtins
     ctx = shell_kwargs.get("ctx", {})
@@ -428,6 +436,8 @@ def main_xonsh(args):
             if env["XONSH_INTERACTIVE"] and not any(
                 os.path.isfile(i) for i in env["XONSHRC"]
             ):
+                from xonsh.xonfig import print_welcome_screen  # lazy import
+
                 print_welcome_screen()
             events.on_pre_cmdloop.fire()
             try:
@@ -510,6 +520,9 @@ def setup(
     threadable_predictors : dict-like, optional
         Threadable predictors to start up with. These overide the defaults.
     """
+    from xonsh.execer import Execer  # lazy import
+    from xonsh.imphooks import install_import_hooks  # lazy import
+
     ctx = {} if ctx is None else ctx
     # setup xonsh ctx and execer
     if not hasattr(builtins, "__xonsh__"):
@@ -16,7 +16,6 @@ import io
 import re
 
 from xonsh.lazyasd import LazyObject
-from xonsh.tokenize import detect_encoding, tokopen
 
 
 cookie_comment_re = LazyObject(
@@ -36,6 +35,9 @@ def source_to_unicode(txt, errors="replace", skip_encoding_cookie=True):
     """
     if isinstance(txt, str):
         return txt
+    # Deferred import for faster start
+    from xonsh.tokenize import detect_encoding
+
     if isinstance(txt, bytes):
         buf = io.BytesIO(txt)
     else:
@@ -87,6 +89,9 @@ def read_py_file(filename, skip_encoding_cookie=True):
     -------
     A unicode string containing the contents of the file.
     """
+    # Deferred import for faster start
+    from xonsh.tokenize import tokopen
+
     with tokopen(filename) as f:  # the open function defined in this module.
         if skip_encoding_cookie:
             return "".join(strip_encoding_cookie(f))